@@ -5,23 +5,28 @@ This script aggregates all token definitions from the mainnet/ directory
 and generates a consolidated token list file following the token list standard.
 """
 
+import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
-
-import json5
+from typing import Any, Optional
 
+ROOT_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = "mainnet"
 OUTPUT_FILE = "tokenlist-mainnet.json"
 TOKEN_LIST_NAME = "Monad Mainnet"
-LOGO_URI = (
-    "https://raw.githubusercontent.com/monad-crypto/token-list/refs/heads/main/assets/monad.svg"
-)
-KEYWORDS = ["monad mainnet"]
+LOGO_URL_PREFIX = "https://raw.githubusercontent.com/monad-crypto/token-list/refs/heads/main/"
+LOGO_URI = LOGO_URL_PREFIX + "assets/monad.svg"
+KEYWORDS = ("monad mainnet",)
 VERSION_MAJOR = 0
 VERSION_MINOR = 0
 VERSION_PATCH = 1
+TOKEN_LIST_TEMPLATE = {
+    "name": TOKEN_LIST_NAME,
+    "logoURI": LOGO_URI,
+    "keywords": KEYWORDS,
+}
 
 
 def get_data_directory() -> Path:
@@ -33,8 +38,7 @@ def get_data_directory() -> Path:
     Raises:
         FileNotFoundError: If the data directory does not exist.
     """
-    script_dir = Path(__file__).resolve().parent
-    data_dir = script_dir.parent / DATA_DIR
+    data_dir = ROOT_DIR / DATA_DIR
 
     if not data_dir.is_dir():
         raise FileNotFoundError(f"Data directory not found: {data_dir}")
@@ -51,12 +55,31 @@ def get_token_dirs(data_dir: Path) -> list[Path]:
     Returns:
         list[Path]: Sorted list of token directory paths.
     """
-    return [f for f in sorted(data_dir.iterdir()) if f.is_dir()]
+    with os.scandir(data_dir) as it:
+        entries = [entry for entry in it if entry.is_dir()]
+    entries.sort(key=lambda entry: entry.name)
+    return [Path(entry.path) for entry in entries]
+
+
+def get_token_files(dir_path: Path) -> dict[str, os.DirEntry[str]]:
+    """Get the files in a token directory.
+
+    Args:
+        dir_path: Path to the token directory.
+
+    Returns:
+        dict[str, os.DirEntry]: Directory entries keyed by file name.
+    """
+    with os.scandir(dir_path) as it:
+        return {entry.name: entry for entry in it}
 
 
 def load_token_data(dir_path: Path) -> dict[str, Any]:
     """Load token data from a directory containing data.json and optional logo file.
 
+    The directory is listed once up front. Whether data.json and the logo files
+    exist is read from that listing, not from separate existence checks.
+
     Args:
         dir_path: Path to the token directory.
 
@@ -68,25 +91,33 @@ def load_token_data(dir_path: Path) -> dict[str, Any]:
         ValueError: If the file cannot be parsed.
         OSError: If the file cannot be read.
     """
+    filepath = dir_path / "data.json"
+    try:
+        files = get_token_files(dir_path)
+    except OSError as e:
+        raise OSError(f"Cannot read {dir_path}: {e}") from e
+    if "data.json" not in files:
+        raise FileNotFoundError(f"Cannot read {filepath}: no such file")
+
     try:
-        filepath = dir_path / "data.json"
         with filepath.open(mode="r", encoding="utf-8") as f:
-            token_data = json5.load(f)
-
-            logo_uri = None
-            for logo_filename in ["logo.svg", "logo.png"]:
-                logo_path = dir_path / logo_filename
-                if logo_path.exists():
-                    logo_uri = logo_path
-                    break
-
-            if logo_uri:
-                root_dir = Path(__file__).resolve().parent.parent
-                token_data["logoURI"] = (
-                    f"https://raw.githubusercontent.com/monad-crypto/token-list/refs/heads/main/{logo_uri.relative_to(root_dir)}"
-                )
-
-            return token_data
+            data = f.read()
+
+        # Token files are almost always plain JSON, so try the C-accelerated
+        # stdlib parser first and only fall back to JSON5 when it rejects the file.
+        try:
+            token_data = json.loads(data)
+        except json.JSONDecodeError:
+            import json5  # noqa: PLC0415
+
+            token_data = json5.loads(data)
+
+        logo_filename = next((name for name in ("logo.svg", "logo.png") if name in files), None)
+
+        if logo_filename:
+            token_data["logoURI"] = f"{LOGO_URL_PREFIX}{DATA_DIR}/{dir_path.name}/{logo_filename}"
+
+        return token_data
     except ValueError as e:
         raise ValueError(f"Invalid JSON5 in {filepath}: {e}") from e
     except OSError as e:
@@ -119,9 +150,7 @@ def create_token_list(tokens: list[dict[str, Any]]) -> dict[str, Any]:
         dict: Complete token list structure.
     """
     return {
-        "name": TOKEN_LIST_NAME,
-        "logoURI": LOGO_URI,
-        "keywords": KEYWORDS,
+        **TOKEN_LIST_TEMPLATE,
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "tokens": tokens,
         "version": {
@@ -132,8 +161,64 @@ def create_token_list(tokens: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
+def serialize_token_list(token_list: dict[str, Any]) -> str:
+    """Serialize the token list to the JSON text written to the output file.
+
+    Args:
+        token_list: The token list data structure.
+
+    Returns:
+        str: The serialized token list.
+    """
+    return json.dumps(token_list, indent=4, ensure_ascii=False)
+
+
+def load_existing_token_list(output_path: Path) -> Optional[str]:
+    """Read the previously generated token list file, if there is one.
+
+    Args:
+        output_path: Path to the generated token list file.
+
+    Returns:
+        str | None: The existing file contents, or None if the file does not exist
+                    or is not valid UTF-8.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    try:
+        with output_path.open(mode="r", encoding="utf-8") as f:
+            return f.read()
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+    except OSError as e:
+        raise OSError(f"Cannot read {output_path}: {e}") from e
+
+
+def is_token_list_unchanged(token_list: dict[str, Any], existing: str) -> bool:
+    """Check whether writing the token list would only change its timestamp.
+
+    Args:
+        token_list: The newly generated token list data structure.
+        existing: Contents of the previously generated file.
+
+    Returns:
+        bool: True if the existing file matches the new list apart from the timestamp.
+    """
+    try:
+        existing_list = json.loads(existing)
+    except ValueError:
+        return False
+    if not isinstance(existing_list, dict) or "timestamp" not in existing_list:
+        return False
+
+    # Serialize with the old timestamp so header, token and format changes all show up
+    candidate = {**token_list, "timestamp": existing_list["timestamp"]}
+    return serialize_token_list(candidate) == existing
+
+
 def write_token_list(token_list: dict[str, Any], output_path: Path) -> None:
-    """Write the token list to a JSON5 file.
+    """Write the token list to a JSON file.
 
     Args:
         token_list: The token list data structure.
@@ -143,14 +228,8 @@ def write_token_list(token_list: dict[str, Any], output_path: Path) -> None:
         IOError: If the file cannot be written.
     """
     try:
-        with output_path.open(mode="w", encoding="utf-8") as f:
-            json5.dump(
-                token_list,
-                f,
-                indent=4,
-                quote_keys=True,
-                trailing_commas=False,
-            )
+        # Serialize up front so the whole file goes out in a single write
+        output_path.write_text(serialize_token_list(token_list), encoding="utf-8")
     except OSError as e:
         raise OSError(f"Cannot write to {output_path}: {e}") from e
 
@@ -174,7 +253,12 @@ def main() -> int:
         tokens = load_all_tokens(token_dirs)
         token_list = create_token_list(tokens)
 
-        output_path = Path(__file__).resolve().parent.parent / OUTPUT_FILE
+        output_path = ROOT_DIR / OUTPUT_FILE
+        existing = load_existing_token_list(output_path)
+        if existing is not None and is_token_list_unchanged(token_list, existing):
+            print(f"No changes detected, '{OUTPUT_FILE}' is up to date")
+            return 0
+
         write_token_list(token_list, output_path)
 
         print(f"Successfully created '{OUTPUT_FILE}'")